@@ -33,6 +33,7 @@
 
 # Configuration
 API_URL="${CLAUDE_TELEGRAM_API_URL:-http://localhost:9999}"
+API_KEY="${CLAUDE_TELEGRAM_API_KEY:-}"
 PROJECT_PATH="${CLAUDE_PROJECT_PATH:-$(pwd)}"
 PROJECT_NAME="$(basename "$PROJECT_PATH")"
 
@@ -75,8 +76,8 @@ if [ -n "$CLAUDE_LAST_ACTION" ] || [ -n "$CLAUDE_TOOLS_USED" ] || [ -n "$CLAUDE_
     fi
 fi
 
-# Generate a unique session ID
-SESSION_ID=$(uuidgen 2>/dev/null || cat /proc/sys/kernel/random/uuid 2>/dev/null || echo "session-$$-$RANDOM")
+# Forward Claude's session ID (scopes "Yes for this session" approvals)
+SESSION_ID="${CLAUDE_SESSION_ID:-}"
 
 # Build the full message with context
 FULL_MESSAGE="$QUESTION"
@@ -105,7 +106,7 @@ JSON_PAYLOAD=$(jq -n \
         project_name: $project_name,
         message: $message,
         requires_response: true,
-        session_id: $session_id,
+        session_id: (if $session_id == "" then null else $session_id end),
         context: {
             interactive: true,
             context_summary: $context_info
@@ -114,6 +115,7 @@ JSON_PAYLOAD=$(jq -n \
 
 # Make the API call and capture response
 RESPONSE=$(curl -s -X POST "${API_URL}/hooks/event" \
+    -H "X-API-Key: ${API_KEY}" \
     -H "Content-Type: application/json" \
     -d "$JSON_PAYLOAD")
 
@@ -129,7 +131,7 @@ SUCCESS=$(echo "$RESPONSE" | jq -r '.success // false')
 
 # Check if API call was successful
 if [ "$SUCCESS" != "true" ]; then
-    ERROR_MSG=$(echo "$RESPONSE" | jq -r '.error // "Unknown error"')
+    ERROR_MSG=$(echo "$RESPONSE" | jq -r '.error // .detail // "Unknown error"')
     echo "❌ API Error: $ERROR_MSG" >&2
     exit 2
 fi
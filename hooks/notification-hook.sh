@@ -7,6 +7,7 @@
 
 # Configuration
 API_URL="${CLAUDE_TELEGRAM_API_URL:-http://localhost:9999}"
+API_KEY="${CLAUDE_TELEGRAM_API_KEY:-}"
 PROJECT_PATH="${CLAUDE_PROJECT_PATH:-$(pwd)}"
 PROJECT_NAME="$(basename "$PROJECT_PATH")"
 
@@ -38,6 +39,7 @@ fi
     }')
 
 curl -s -X POST "${API_URL}/hooks/event" \
+    -H "X-API-Key: ${API_KEY}" \
     -H "Content-Type: application/json" \
     -d "$JSON_PAYLOAD" > /dev/null 2>&1 &)
 
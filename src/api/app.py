@@ -1,20 +1,57 @@
 # ABOUTME: FastAPI application for receiving Claude hook events and managing notifications.
 # ABOUTME: Provides REST endpoints for hooks, project management, and health checks.
 
+import asyncio
 import logging
+import math
+import re
 import uuid
 from contextlib import asynccontextmanager
+from typing import List, Optional
 
-from fastapi import FastAPI, HTTPException
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 
+from src.api.approvals import approval_cache, fingerprint_event
+from src.api.broadcaster import event_broadcaster, format_sse
+from src.api.quotas import quota_manager
 from src.bot import telegram_bot
-from src.config import projects_manager, settings
-from src.models import HookEvent, HookResponse, ResponseType
+from src.config import (
+    TelegramDestination,
+    clients_manager,
+    projects_manager,
+    settings,
+)
+from src.models import (
+    ApprovalScope,
+    HookEvent,
+    HookResponse,
+    HookType,
+    ResponseType,
+)
 
 logger = logging.getLogger(__name__)
 
 
+class RedactApiKeyFilter(logging.Filter):
+    """Redact api_key query parameters from uvicorn access log lines."""
+
+    pattern = re.compile(r"(api_key=)[^&\s]*")
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if isinstance(record.args, tuple):
+            record.args = tuple(
+                self.pattern.sub(r"\1***", arg) if isinstance(arg, str) else arg
+                for arg in record.args
+            )
+        return True
+
+
+# uvicorn configures its loggers before importing the app, so this sticks
+logging.getLogger("uvicorn.access").addFilter(RedactApiKeyFilter())
+
+
 def format_notification_message(event: HookEvent) -> str:
     """
     Format a hook event into a simple, clean message.
@@ -36,11 +73,30 @@ def format_notification_message(event: HookEvent) -> str:
         return f"**{project_name}** | {hook_type}"
 
 
+async def send_auto_approval_log(
+    destinations: List[TelegramDestination], message: str
+) -> None:
+    """Silently log an auto-approved prompt to Telegram (runs in background)."""
+    try:
+        await telegram_bot.send_notification(
+            destinations=destinations,
+            message=f"{message}\n\n🤖 Auto-approved by policy",
+            silent=True,
+        )
+    except Exception as e:
+        logger.error(f"Error sending auto-approval log: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifecycle (startup/shutdown)."""
     # Startup
     logger.info("Starting Claude-Telegram Notificator API")
+    if not clients_manager.is_auth_enabled():
+        logger.warning(
+            f"No API clients configured in {clients_manager.config_path}; "
+            "API keys are not required"
+        )
     await telegram_bot.start()
     logger.info(f"API listening on {settings.api_host}:{settings.api_port}")
     yield
@@ -57,14 +113,106 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# Add CORS middleware for future web UI
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # TODO: Restrict in production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+
+def is_protected_request(request: Request) -> bool:
+    """Check if a request needs an API key and counts against quotas."""
+    path = request.url.path
+    if path in ("/hooks/event", "/events/stream", "/clients/usage", "/projects"):
+        return True
+    return request.method == "POST" and path.startswith("/projects/")
+
+
+def anonymous_quota_key(request: Request) -> str:
+    """Quota key for callers without an API key (per client IP)."""
+    host = request.client.host if request.client else "unknown"
+    return f"anonymous:{host}"
+
+
+@app.middleware("http")
+async def enforce_api_key_and_quota(request: Request, call_next):
+    """
+    Authenticate and rate-limit protected requests.
+
+    Runs before the request body is read so over-quota requests are cheap.
+    """
+    if not is_protected_request(request):
+        return await call_next(request)
+
+    client = None
+    if clients_manager.is_auth_enabled():
+        # Query parameter fallback for browser EventSource, which can't set headers
+        api_key = request.headers.get("X-API-Key") or request.query_params.get(
+            "api_key", ""
+        )
+        client = clients_manager.get_client(api_key)
+        if client is None:
+            return JSONResponse(
+                status_code=401, content={"detail": "Invalid or missing API key"}
+            )
+        quota_key = client.name
+        requests_per_minute = (
+            client.requests_per_minute or settings.quota_requests_per_minute
+        )
+        burst = client.burst or settings.quota_burst
+    else:
+        quota_key = anonymous_quota_key(request)
+        requests_per_minute = settings.quota_requests_per_minute
+        burst = settings.quota_burst
+
+    retry_after = quota_manager.acquire(quota_key, requests_per_minute, burst)
+    if retry_after:
+        logger.warning(f"Quota exceeded for {quota_key}")
+        return JSONResponse(
+            status_code=429,
+            content={"detail": "Rate limit exceeded"},
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+    request.state.client = client
+    return await call_next(request)
+
+
+def authorize_project(request: Request, project_path: str) -> None:
+    """Reject requests from clients not allowed to act on a project."""
+    client = getattr(request.state, "client", None)
+    if client and not client.allows_project(project_path):
+        raise HTTPException(
+            status_code=403, detail=f"Client not allowed for project: {project_path}"
+        )
+
+
+class RouteAwareCORSMiddleware:
+    """
+    CORS middleware for future web UI.
+
+    The event stream exposes hook content, so it only allows the origins in
+    stream_cors_allow_origins (none by default) instead of cors_allow_origins.
+    """
+
+    def __init__(self, app):
+        self.default = CORSMiddleware(
+            app,
+            allow_origins=settings.cors_allow_origins,
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+        self.stream = CORSMiddleware(
+            app,
+            allow_origins=settings.stream_cors_allow_origins,
+            allow_methods=["GET"],
+            allow_headers=["X-API-Key"],
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == "/events/stream":
+            await self.stream(scope, receive, send)
+        else:
+            await self.default(scope, receive, send)
+
+
+# Added last so CORS wraps error responses
+app.add_middleware(RouteAwareCORSMiddleware)
 
 
 @app.get("/")
@@ -88,12 +236,16 @@ async def health():
 
 
 @app.post("/hooks/event", response_model=HookResponse)
-async def receive_hook_event(event: HookEvent):
+async def receive_hook_event(
+    event: HookEvent, request: Request, background_tasks: BackgroundTasks
+):
     """
     Receive a hook event from Claude Code and send to Telegram.
 
-    This is the main endpoint called by Claude hooks.
+    This is the main endpoint called by Claude hooks. Events accepted for
+    delivery and their outcomes are also published to live stream subscribers.
     """
+    authorize_project(request, event.project_path)
     logger.info(f"Received hook event: {event.hook_type} from {event.project_path}")
 
     # Check if notifications are enabled for this project
@@ -105,28 +257,94 @@ async def receive_hook_event(event: HookEvent):
             message="Notifications disabled for this project",
         )
 
-    # Get chat ID for the project
-    chat_id = projects_manager.get_chat_id(event.project_path)
-    if not chat_id:
+    # Per-prompt ID for tracking the Telegram response; event.session_id is
+    # only used to scope auto-approvals and may be shared by many prompts
+    request_id = uuid.uuid4().hex
+
+    hook_type = event.hook_type.value
+    event_broadcaster.publish(
+        "hook_event",
+        event.project_path,
+        hook_type,
+        {"request_id": request_id, "event": event.model_dump(mode="json")},
+    )
+
+    try:
+        response = await process_hook_event(event, request_id, background_tasks)
+    except HTTPException as e:
+        event_broadcaster.publish(
+            "hook_response",
+            event.project_path,
+            hook_type,
+            {"request_id": request_id, "success": False, "error": e.detail},
+        )
+        raise
+
+    event_broadcaster.publish(
+        "hook_response",
+        event.project_path,
+        hook_type,
+        {"request_id": request_id, **response.model_dump(mode="json")},
+    )
+    return response
+
+
+async def process_hook_event(
+    event: HookEvent, request_id: str, background_tasks: BackgroundTasks
+) -> HookResponse:
+    """
+    Deliver a hook event to Telegram and wait for a response if required.
+
+    Args:
+        event: The hook event to deliver
+        request_id: Per-prompt ID used to track the response
+        background_tasks: Tasks to run after the response is sent
+
+    Returns:
+        HookResponse to return to the hook
+    """
+    destinations = projects_manager.get_destinations(event.project_path)
+
+    # Format the message for Telegram
+    formatted_message = format_notification_message(event)
+
+    # Answer repeat prompts covered by an auto-approval policy instantly; they
+    # need no human, so this works even without a configured chat
+    fingerprint = fingerprint_event(event)
+    if event.requires_response and approval_cache.match(
+        event.project_path, event.session_id, fingerprint
+    ):
+        logger.info(f"Auto-approved {event.hook_type} for {event.project_path}")
+        if destinations:
+            background_tasks.add_task(
+                send_auto_approval_log, destinations, formatted_message
+            )
+        return HookResponse(
+            success=True,
+            response_type=ResponseType.YES,
+            message="Auto-approved by policy",
+        )
+
+    if not destinations:
         logger.error("No Telegram chat ID configured")
         raise HTTPException(
             status_code=500,
             detail="No Telegram chat ID configured. Run /start with the bot.",
         )
 
-    # Generate session ID if needed
-    session_id = event.session_id or str(uuid.uuid4())
+    # Session scope only makes sense when the hook supplies a session ID
+    approval_scopes = [ApprovalScope.TIMED, ApprovalScope.PROJECT]
+    if event.session_id:
+        approval_scopes.insert(1, ApprovalScope.SESSION)
 
     try:
-        # Format the message for Telegram
-        formatted_message = format_notification_message(event)
-
         # Send notification to Telegram
         telegram_response = await telegram_bot.send_notification(
-            chat_id=chat_id,
+            destinations=destinations,
             message=formatted_message,
-            session_id=session_id,
+            request_id=request_id,
             requires_response=event.requires_response,
+            approval_scopes=approval_scopes,
         )
 
         # If no response required, return success
@@ -137,6 +355,18 @@ async def receive_hook_event(event: HookEvent):
                 message="Notification sent",
             )
 
+        # Remember scoped approvals for matching prompts
+        if (
+            telegram_response.response_type == ResponseType.YES
+            and telegram_response.approval_scope
+        ):
+            approval_cache.record(
+                telegram_response.approval_scope,
+                event.project_path,
+                event.session_id,
+                fingerprint,
+            )
+
         # Return the user's response
         return HookResponse(
             success=True,
@@ -149,9 +379,69 @@ async def receive_hook_event(event: HookEvent):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/events/stream")
+async def stream_events(
+    request: Request,
+    project_path: List[str] = Query(default=[]),
+    hook_type: List[HookType] = Query(default=[]),
+):
+    """
+    Stream hook events and their outcomes as Server-Sent Events.
+
+    Optionally filtered by project path and hook type. Each subscriber has a
+    bounded buffer; when a reader falls behind the oldest events are dropped
+    and a "dropped" event reports how many were lost.
+    """
+    if not clients_manager.is_auth_enabled() and not settings.stream_allow_anonymous:
+        raise HTTPException(
+            status_code=403,
+            detail="Event stream requires API keys (or STREAM_ALLOW_ANONYMOUS=true)",
+        )
+
+    project_paths = set(project_path)
+    client = getattr(request.state, "client", None)
+    if client and client.projects:
+        allowed = set(client.projects)
+        project_paths = project_paths & allowed if project_paths else allowed
+        if not project_paths:
+            raise HTTPException(status_code=403, detail="No allowed projects to stream")
+
+    subscriber = event_broadcaster.subscribe(
+        project_paths, {hook.value for hook in hook_type}
+    )
+    if subscriber is None:
+        raise HTTPException(status_code=503, detail="Too many stream subscribers")
+
+    async def stream():
+        try:
+            while True:
+                try:
+                    message = await asyncio.wait_for(
+                        subscriber.queue.get(),
+                        timeout=settings.stream_keepalive_seconds,
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+
+                if subscriber.dropped:
+                    yield format_sse("dropped", {"count": subscriber.dropped})
+                    subscriber.dropped = 0
+                yield format_sse(message["type"], message, message["id"])
+        finally:
+            event_broadcaster.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/projects")
-async def list_projects():
-    """List all configured projects."""
+async def list_projects(request: Request):
+    """List configured projects (only allowed ones for API keys)."""
+    client = getattr(request.state, "client", None)
     return {
         "projects": [
             {
@@ -159,33 +449,88 @@ async def list_projects():
                 "name": project.name,
                 "enabled": project.enabled,
                 "chat_id": project.telegram_chat_id,
+                "destinations": [
+                    destination.model_dump() for destination in project.destinations
+                ],
             }
             for project in projects_manager.projects.values()
+            if client is None or client.allows_project(project.project_path)
         ]
     }
 
 
 @app.post("/projects/add")
-async def add_project(project_path: str, name: str, enabled: bool = True):
+async def add_project(
+    request: Request, project_path: str, name: str, enabled: bool = True
+):
     """Add a new project configuration."""
+    authorize_project(request, project_path)
     projects_manager.add_project(project_path, name, enabled)
     return {"success": True, "message": f"Project '{name}' added"}
 
 
 @app.post("/projects/{project_path:path}/enable")
-async def enable_project(project_path: str):
+async def enable_project(request: Request, project_path: str):
     """Enable notifications for a project."""
+    authorize_project(request, project_path)
     projects_manager.enable_project(project_path)
     return {"success": True, "message": f"Project enabled: {project_path}"}
 
 
 @app.post("/projects/{project_path:path}/disable")
-async def disable_project(project_path: str):
+async def disable_project(request: Request, project_path: str):
     """Disable notifications for a project."""
+    authorize_project(request, project_path)
     projects_manager.disable_project(project_path)
     return {"success": True, "message": f"Project disabled: {project_path}"}
 
 
+@app.post("/projects/{project_path:path}/approvals/clear")
+async def clear_project_approvals(request: Request, project_path: str):
+    """Revoke all auto-approval policies for a project."""
+    authorize_project(request, project_path)
+    approval_cache.clear(project_path)
+    return {"success": True, "message": f"Approvals cleared: {project_path}"}
+
+
+@app.post("/projects/{project_path:path}/destinations/add")
+async def add_project_destination(
+    request: Request,
+    project_path: str,
+    chat_id: str,
+    message_thread_id: Optional[int] = None,
+):
+    """Add a Telegram destination (chat or forum topic) to a project."""
+    authorize_project(request, project_path)
+    if not projects_manager.add_destination(project_path, chat_id, message_thread_id):
+        raise HTTPException(status_code=404, detail=f"Unknown project: {project_path}")
+    return {"success": True, "message": f"Destination added: {chat_id}"}
+
+
+@app.post("/projects/{project_path:path}/destinations/remove")
+async def remove_project_destination(
+    request: Request,
+    project_path: str,
+    chat_id: str,
+    message_thread_id: Optional[int] = None,
+):
+    """Remove a Telegram destination from a project."""
+    authorize_project(request, project_path)
+    if not projects_manager.remove_destination(
+        project_path, chat_id, message_thread_id
+    ):
+        raise HTTPException(status_code=404, detail=f"Unknown destination: {chat_id}")
+    return {"success": True, "message": f"Destination removed: {chat_id}"}
+
+
+@app.get("/clients/usage")
+async def clients_usage(request: Request):
+    """Get the caller's own accepted/rejected request counters."""
+    client = getattr(request.state, "client", None)
+    quota_key = client.name if client else anonymous_quota_key(request)
+    return {"usage": {quota_key: quota_manager.usage.get(quota_key, {})}}
+
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -0,0 +1,116 @@
+# ABOUTME: In-memory cache of scoped auto-approval policies for interactive prompts.
+# ABOUTME: Lets repeat prompts be answered server-side without waiting on Telegram.
+
+import hashlib
+import time
+from typing import Dict, Optional, Tuple
+
+from src.config import settings
+from src.models import ApprovalScope, HookEvent
+
+# (project_path, session_id or None, fingerprint)
+PolicyKey = Tuple[str, Optional[str], str]
+
+
+def fingerprint_event(event: HookEvent) -> str:
+    """
+    Fingerprint the question asked by a hook event.
+
+    The hook type and message are normalized (case and whitespace) so that
+    trivially different renderings of the same prompt match.
+    """
+    normalized = " ".join(event.message.lower().split())
+    raw = f"{event.hook_type.value}:{normalized}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+class ApprovalCache:
+    """Stores auto-approval policies with per-scope expiry."""
+
+    def __init__(self):
+        # Policy key -> expiry timestamp (None never expires)
+        self.policies: Dict[PolicyKey, Optional[float]] = {}
+
+    def _key(
+        self,
+        scope: ApprovalScope,
+        project_path: str,
+        session_id: Optional[str],
+        fingerprint: str,
+    ) -> PolicyKey:
+        """Build the cache key for a scope; only session scope uses the session."""
+        if scope == ApprovalScope.SESSION:
+            return (project_path, session_id, fingerprint)
+        return (project_path, None, fingerprint)
+
+    def _expiry(self, scope: ApprovalScope, now: float) -> Optional[float]:
+        """Get the expiry timestamp for a new policy of the given scope."""
+        if scope == ApprovalScope.TIMED:
+            return now + settings.approval_window_seconds
+        if scope == ApprovalScope.SESSION:
+            return now + settings.approval_session_ttl
+        return None
+
+    def record(
+        self,
+        scope: ApprovalScope,
+        project_path: str,
+        session_id: Optional[str],
+        fingerprint: str,
+    ) -> None:
+        """Record an approval policy."""
+        if scope == ApprovalScope.SESSION and not session_id:
+            return
+
+        now = time.time()
+        self.prune(now)
+        key = self._key(scope, project_path, session_id, fingerprint)
+        expiry = self._expiry(scope, now)
+
+        # Never shorten an existing policy
+        current = self.policies.get(key, 0.0)
+        if current is None or (expiry is not None and current > expiry):
+            return
+        self.policies[key] = expiry
+
+    def match(
+        self, project_path: str, session_id: Optional[str], fingerprint: str
+    ) -> bool:
+        """Check whether a prompt is covered by an unexpired policy."""
+        now = time.time()
+        keys = [(project_path, None, fingerprint)]
+        if session_id:
+            keys.append((project_path, session_id, fingerprint))
+
+        for key in keys:
+            if key not in self.policies:
+                continue
+            expiry = self.policies[key]
+            if expiry is None or expiry > now:
+                return True
+            del self.policies[key]
+        return False
+
+    def prune(self, now: Optional[float] = None) -> None:
+        """Drop expired policies."""
+        now = now or time.time()
+        self.policies = {
+            key: expiry
+            for key, expiry in self.policies.items()
+            if expiry is None or expiry > now
+        }
+
+    def clear(self, project_path: Optional[str] = None) -> None:
+        """Remove all policies, or only those of one project."""
+        if project_path is None:
+            self.policies = {}
+            return
+        self.policies = {
+            key: expiry
+            for key, expiry in self.policies.items()
+            if key[0] != project_path
+        }
+
+
+# Global approval cache instance
+approval_cache = ApprovalCache()
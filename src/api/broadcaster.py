@@ -0,0 +1,95 @@
+# ABOUTME: Fan-out of hook events and their outcomes to live stream subscribers.
+# ABOUTME: Bounded drop-oldest buffers keep slow subscribers from blocking ingestion.
+
+import asyncio
+import itertools
+import json
+from typing import Any, Dict, Optional, Set
+
+from src.config import settings
+
+
+class Subscriber:
+    """A live stream subscriber with a bounded buffer and optional filters."""
+
+    def __init__(
+        self,
+        buffer_size: int,
+        project_paths: Optional[Set[str]] = None,
+        hook_types: Optional[Set[str]] = None,
+    ):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+        self.project_paths = project_paths or set()
+        self.hook_types = hook_types or set()
+        self.dropped = 0
+
+    def matches(self, message: Dict[str, Any]) -> bool:
+        """Check if a message passes this subscriber's filters."""
+        if self.project_paths and message["project_path"] not in self.project_paths:
+            return False
+        if self.hook_types and message["hook_type"] not in self.hook_types:
+            return False
+        return True
+
+    def push(self, message: Dict[str, Any]) -> None:
+        """Buffer a message without blocking, dropping the oldest when full."""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(message)
+
+
+class EventBroadcaster:
+    """Publishes messages to every matching subscriber."""
+
+    def __init__(self):
+        self.subscribers: Set[Subscriber] = set()
+        self._ids = itertools.count(1)
+
+    def subscribe(
+        self,
+        project_paths: Optional[Set[str]] = None,
+        hook_types: Optional[Set[str]] = None,
+    ) -> Optional[Subscriber]:
+        """Register a subscriber. Returns None when the subscriber limit is hit."""
+        if len(self.subscribers) >= settings.stream_max_subscribers:
+            return None
+        subscriber = Subscriber(settings.stream_buffer_size, project_paths, hook_types)
+        self.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        """Remove a subscriber."""
+        self.subscribers.discard(subscriber)
+
+    def publish(
+        self, message_type: str, project_path: str, hook_type: str, data: Dict
+    ) -> None:
+        """
+        Publish a message to all matching subscribers.
+
+        Never awaits, so publishing adds no latency to the caller.
+        """
+        if not self.subscribers:
+            return
+
+        message = {
+            "id": next(self._ids),
+            "type": message_type,
+            "project_path": project_path,
+            "hook_type": hook_type,
+            "data": data,
+        }
+        for subscriber in list(self.subscribers):
+            if subscriber.matches(message):
+                subscriber.push(message)
+
+
+def format_sse(event: str, data: Dict[str, Any], event_id: Optional[int] = None) -> str:
+    """Format a Server-Sent Events frame."""
+    frame = f"id: {event_id}\n" if event_id is not None else ""
+    return frame + f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+# Global event broadcaster instance
+event_broadcaster = EventBroadcaster()
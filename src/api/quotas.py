@@ -0,0 +1,94 @@
+# ABOUTME: In-memory token-bucket quotas and usage counters for API clients.
+# ABOUTME: Keeps one noisy client from flooding the server and the Telegram budget.
+
+import time
+from typing import Dict
+
+# Buckets (and their usage counters) are pruned once this many are tracked
+MAX_BUCKETS = 10000
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a fixed rate."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last update."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self) -> float:
+        """
+        Take one token.
+
+        Returns:
+            0.0 if a token was taken, otherwise seconds until one is available
+        """
+        self._refill(time.monotonic())
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def is_full(self) -> bool:
+        """Check if the bucket has fully refilled (i.e. the client is idle)."""
+        elapsed = time.monotonic() - self.updated
+        return self.tokens + elapsed * self.rate >= self.capacity
+
+
+class QuotaManager:
+    """Tracks a token bucket and usage counters per client."""
+
+    def __init__(self):
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.usage: Dict[str, Dict[str, int]] = {}
+
+    def acquire(self, client: str, requests_per_minute: int, burst: int) -> float:
+        """
+        Charge one request to a client's quota.
+
+        Returns:
+            0.0 if allowed, otherwise seconds to wait before retrying
+        """
+        bucket = self.buckets.get(client)
+        rate = requests_per_minute / 60
+        if bucket is None or bucket.rate != rate or bucket.capacity != burst:
+            if len(self.buckets) >= MAX_BUCKETS:
+                self.prune()
+            bucket = self.buckets[client] = TokenBucket(rate, burst)
+
+        retry_after = bucket.acquire()
+        counters = self.usage.setdefault(client, {"accepted": 0, "rejected": 0})
+        counters["rejected" if retry_after else "accepted"] += 1
+        return retry_after
+
+    def prune(self) -> None:
+        """
+        Drop idle buckets (they start full again on next use), then the least
+        recently used ones if still at the limit. Usage counters go with them.
+        """
+        self.buckets = {
+            client: bucket
+            for client, bucket in self.buckets.items()
+            if not bucket.is_full()
+        }
+        if len(self.buckets) >= MAX_BUCKETS:
+            by_last_use = sorted(
+                self.buckets, key=lambda client: self.buckets[client].updated
+            )
+            for client in by_last_use[: len(self.buckets) - MAX_BUCKETS + 1]:
+                del self.buckets[client]
+        self.usage = {
+            client: counters
+            for client, counters in self.usage.items()
+            if client in self.buckets
+        }
+
+
+# Global quota manager instance
+quota_manager = QuotaManager()
@@ -4,23 +4,34 @@
 import asyncio
 import logging
 import time
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.ext import Application, CallbackQueryHandler, CommandHandler, ContextTypes
 
-from src.config import settings
-from src.models import ResponseType, TelegramResponse
+from src.config import TelegramDestination, settings
+from src.models import ApprovalScope, ResponseType, TelegramResponse
 
 logger = logging.getLogger(__name__)
 
 
+def approval_scope_label(scope: ApprovalScope) -> str:
+    """Human-readable label for an auto-approval scope."""
+    if scope == ApprovalScope.TIMED:
+        return f"for {settings.approval_window_seconds // 60} min"
+    if scope == ApprovalScope.SESSION:
+        return "for this session"
+    return "always for this project"
+
+
 class TelegramBot:
     """Manages Telegram bot for sending notifications and receiving responses."""
 
     def __init__(self):
         self.app: Optional[Application] = None
         self.pending_responses: Dict[str, asyncio.Future] = {}
+        # Every copy of an interactive message, keyed by request ID
+        self.sent_messages: Dict[str, List[Tuple[str, int]]] = {}
         self.is_running = False
 
     async def start(self) -> None:
@@ -95,12 +106,18 @@ class TelegramBot:
 
         await query.answer()
 
-        # Parse callback data: "session_id:response_type"
-        parts = query.data.split(":", 1)
-        if len(parts) != 2:
+        # Parse callback data: "request_id:response_type[:approval_scope]"
+        parts = query.data.split(":", 2)
+        if len(parts) < 2:
             return
 
-        session_id, response_value = parts
+        request_id, response_value = parts[0], parts[1]
+        approval_scope = None
+        if len(parts) == 3:
+            try:
+                approval_scope = ApprovalScope(parts[2])
+            except ValueError:
+                return
 
         # Determine response type
         if response_value == "yes":
@@ -117,100 +134,213 @@ class TelegramBot:
         response = TelegramResponse(
             response_type=response_type,
             message=message,
-            session_id=session_id,
+            request_id=request_id,
+            approval_scope=approval_scope,
             timestamp=time.time(),
         )
 
-        # Resolve the pending future if exists
-        if session_id in self.pending_responses:
-            future = self.pending_responses[session_id]
-            if not future.done():
-                future.set_result(response)
+        # First answer wins; later clicks on other copies are ignored
+        future = self.pending_responses.get(request_id)
+        if future is None or future.done():
+            await query.edit_message_text("ℹ️ This prompt was already answered")
+            return
+        future.set_result(response)
+
+        # Update every copy of the message
+        await self._update_sent_messages(request_id, self._response_text(response))
+
+    @staticmethod
+    def _response_text(response: TelegramResponse) -> str:
+        """Text shown in place of an answered prompt."""
+        emoji = "✅" if response.response_type == ResponseType.YES else "❌"
+        text = f"{emoji} Response received: {response.response_type.value}"
+        if response.approval_scope:
+            text += f" ({approval_scope_label(response.approval_scope)})"
+        return text
+
+    async def _update_sent_messages(self, request_id: str, text: str) -> None:
+        """Edit all copies of an interactive message, isolating failures."""
+        if not self.app:
+            return
 
-        # Update message
-        emoji = "✅" if response_type == ResponseType.YES else "❌"
-        await query.edit_message_text(
-            f"{emoji} Response received: {response_type.value}"
+        copies = self.sent_messages.get(request_id, [])
+        results = await asyncio.gather(
+            *(
+                self.app.bot.edit_message_text(
+                    text=text, chat_id=chat_id, message_id=message_id
+                )
+                for chat_id, message_id in copies
+            ),
+            return_exceptions=True,
         )
+        for (chat_id, _), result in zip(copies, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to update message in chat {chat_id}: {result}")
 
     async def send_notification(
         self,
-        chat_id: str,
+        destinations: List[TelegramDestination],
         message: str,
-        session_id: Optional[str] = None,
+        request_id: Optional[str] = None,
         requires_response: bool = False,
+        approval_scopes: Sequence[ApprovalScope] = (),
+        silent: bool = False,
     ) -> Optional[TelegramResponse]:
         """
-        Send a notification to Telegram.
+        Send a notification to one or more Telegram destinations concurrently.
+
+        A failing destination is logged and does not affect the others. The
+        first answer from any destination resolves the pending response.
 
         Args:
-            chat_id: Telegram chat ID to send to
+            destinations: Telegram chats (or forum topics) to send to
             message: Message text to send (already formatted)
-            session_id: Optional session ID for tracking responses
+            request_id: Per-prompt ID for tracking responses (short, for callback data)
             requires_response: Whether to wait for user response
+            approval_scopes: Auto-approval scopes to offer as extra "yes" buttons
+            silent: Deliver without a notification sound
 
         Returns:
             TelegramResponse if requires_response=True, None otherwise
+
+        Raises:
+            RuntimeError: If the bot is not started or every destination failed
         """
         if not self.app:
             raise RuntimeError("Bot is not started")
 
         # Create inline keyboard if response is required
         reply_markup = None
-        if requires_response and session_id:
+        wait_for_response = bool(requires_response and request_id)
+        if wait_for_response:
             keyboard = [
                 [
-                    InlineKeyboardButton("✅ Yes", callback_data=f"{session_id}:yes"),
-                    InlineKeyboardButton("❌ No", callback_data=f"{session_id}:no"),
+                    InlineKeyboardButton("✅ Yes", callback_data=f"{request_id}:yes"),
+                    InlineKeyboardButton("❌ No", callback_data=f"{request_id}:no"),
                 ]
             ]
+            keyboard.extend(
+                [
+                    InlineKeyboardButton(
+                        f"✅ Yes {approval_scope_label(scope)}",
+                        callback_data=f"{request_id}:yes:{scope.value}",
+                    )
+                ]
+                for scope in approval_scopes
+            )
             reply_markup = InlineKeyboardMarkup(keyboard)
+            # Register before sending so an early click is not lost
+            self.pending_responses[request_id] = asyncio.Future()
+            self.sent_messages[request_id] = []
+
+        # Send to every destination concurrently
+        results = await asyncio.gather(
+            *(
+                self._send_to_destination(
+                    destination,
+                    message,
+                    reply_markup,
+                    silent,
+                    request_id if wait_for_response else None,
+                )
+                for destination in destinations
+            ),
+            return_exceptions=True,
+        )
+
+        delivered = 0
+        for destination, result in zip(destinations, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Failed to send notification to chat {destination.chat_id}: "
+                    f"{result}"
+                )
+                continue
+            delivered += 1
+            logger.info(f"Sent notification to chat {destination.chat_id}")
+
+        if not delivered:
+            if wait_for_response:
+                self.pending_responses.pop(request_id, None)
+                self.sent_messages.pop(request_id, None)
+            raise RuntimeError("Failed to send notification to any destination")
+
+        # Wait for response if required
+        if wait_for_response:
+            return await self._wait_for_response(request_id)
+
+        return None
+
+    async def _send_to_destination(
+        self,
+        destination: TelegramDestination,
+        message: str,
+        reply_markup: Optional[InlineKeyboardMarkup],
+        silent: bool,
+        request_id: Optional[str],
+    ) -> None:
+        """
+        Send a message to one destination, tracking it for later edits.
 
-        # Send message
-        await self.app.bot.send_message(
-            chat_id=chat_id,
+        If the prompt was already answered from a faster destination, this
+        copy is updated as soon as it is sent.
+        """
+        sent = await self.app.bot.send_message(
+            chat_id=destination.chat_id,
+            message_thread_id=destination.message_thread_id,
             text=message,
             reply_markup=reply_markup,
             parse_mode="Markdown",
+            disable_notification=silent,
         )
+        if request_id is None or request_id not in self.sent_messages:
+            return
 
-        logger.info(f"Sent notification to chat {chat_id}")
-
-        # Wait for response if required
-        if requires_response and session_id:
-            return await self._wait_for_response(session_id)
+        self.sent_messages[request_id].append((destination.chat_id, sent.message_id))
+        future = self.pending_responses.get(request_id)
+        if future is None or not future.done():
+            return
 
-        return None
+        try:
+            await self.app.bot.edit_message_text(
+                text=self._response_text(future.result()),
+                chat_id=destination.chat_id,
+                message_id=sent.message_id,
+            )
+        except Exception as e:
+            logger.warning(
+                f"Failed to update message in chat {destination.chat_id}: {e}"
+            )
 
-    async def _wait_for_response(self, session_id: str) -> TelegramResponse:
+    async def _wait_for_response(self, request_id: str) -> TelegramResponse:
         """
         Wait for a user response with timeout.
 
         Args:
-            session_id: Session ID to wait for
+            request_id: Request ID to wait for
 
         Returns:
             TelegramResponse object
         """
-        # Create a future for this response
-        future: asyncio.Future = asyncio.Future()
-        self.pending_responses[session_id] = future
+        future = self.pending_responses.setdefault(request_id, asyncio.Future())
 
         try:
             # Wait for response with timeout
             response = await asyncio.wait_for(future, timeout=settings.response_timeout)
             return response
         except asyncio.TimeoutError:
-            logger.warning(f"Response timeout for session {session_id}")
+            logger.warning(f"Response timeout for request {request_id}")
+            await self._update_sent_messages(request_id, "⏱️ Response timed out")
             return TelegramResponse(
                 response_type=ResponseType.TIMEOUT,
                 message=None,
-                session_id=session_id,
+                request_id=request_id,
                 timestamp=time.time(),
             )
         finally:
             # Clean up
-            self.pending_responses.pop(session_id, None)
+            self.pending_responses.pop(request_id, None)
+            self.sent_messages.pop(request_id, None)
 
 
 # Global bot instance
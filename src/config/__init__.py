@@ -1,7 +1,21 @@
 # ABOUTME: Configuration module exports for easy imports.
 # ABOUTME: Provides centralized access to settings and project management.
 
-from src.config.projects import ProjectsManager, projects_manager
+from src.config.clients import ClientConfig, ClientsManager, clients_manager
+from src.config.projects import (
+    ProjectsManager,
+    TelegramDestination,
+    projects_manager,
+)
 from src.config.settings import Settings, settings
 
-__all__ = ["Settings", "settings", "ProjectsManager", "projects_manager"]
+__all__ = [
+    "Settings",
+    "settings",
+    "ClientConfig",
+    "ClientsManager",
+    "clients_manager",
+    "ProjectsManager",
+    "TelegramDestination",
+    "projects_manager",
+]
@@ -0,0 +1,72 @@
+# ABOUTME: API client configuration mapping API keys to clients, projects and quotas.
+# ABOUTME: Authentication is enforced only once at least one client is configured.
+
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from src.config.settings import settings
+
+
+class ClientConfig(BaseModel):
+    """Configuration for an API client identified by its API key."""
+
+    name: str = Field(description="Client name used for quotas and usage")
+    projects: List[str] = Field(
+        default_factory=list,
+        description="Project paths the client may use (empty allows all)",
+    )
+    requests_per_minute: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Sustained request quota (falls back to default)",
+    )
+    burst: Optional[int] = Field(
+        default=None, ge=1, description="Maximum burst size (falls back to default)"
+    )
+
+    def allows_project(self, project_path: str) -> bool:
+        """Check if the client may act on a project."""
+        return not self.projects or project_path in self.projects
+
+
+class ClientsManager:
+    """Manages API client configurations keyed by API key."""
+
+    def __init__(self, config_path: Optional[Path] = None):
+        self.config_path = config_path or settings.clients_config_path
+        self.clients: Dict[str, ClientConfig] = {}
+        self.load()
+
+    def load(self) -> None:
+        """Load clients configuration from disk (missing file means no clients)."""
+        if self.config_path.exists():
+            with open(self.config_path, "r") as f:
+                data = json.load(f)
+                self.clients = {
+                    key: ClientConfig(**value) for key, value in data.items()
+                }
+        else:
+            self.clients = {}
+
+        # Quotas and usage are tracked by name, so names must be unique
+        names = [client.name for client in self.clients.values()]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(
+                f"Duplicate client names in {self.config_path}: {', '.join(duplicates)}"
+            )
+
+    def is_auth_enabled(self) -> bool:
+        """Check if API keys are required."""
+        return bool(self.clients)
+
+    def get_client(self, api_key: str) -> Optional[ClientConfig]:
+        """Get the client for an API key."""
+        return self.clients.get(api_key)
+
+
+# Global clients manager instance
+clients_manager = ClientsManager()
@@ -3,13 +3,22 @@
 
 import json
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
 from src.config.settings import settings
 
 
+class TelegramDestination(BaseModel):
+    """A single Telegram chat (optionally a forum topic) to deliver to."""
+
+    chat_id: str = Field(description="Telegram chat ID")
+    message_thread_id: Optional[int] = Field(
+        default=None, description="Forum topic ID within the chat"
+    )
+
+
 class ProjectConfig(BaseModel):
     """Configuration for a specific project."""
 
@@ -18,6 +27,10 @@ class ProjectConfig(BaseModel):
     telegram_chat_id: Optional[str] = Field(
         default=None, description="Project-specific Telegram chat ID"
     )
+    destinations: List[TelegramDestination] = Field(
+        default_factory=list,
+        description="Additional Telegram destinations (chats or forum topics)",
+    )
     project_path: str = Field(description="Absolute path to project directory")
 
 
@@ -86,6 +99,66 @@ class ProjectsManager:
             return project.telegram_chat_id
         return settings.telegram_chat_id
 
+    def get_destinations(self, project_path: str) -> List[TelegramDestination]:
+        """
+        Get every Telegram destination for a project.
+
+        The project's own chat ID comes first, followed by its extra
+        destinations. The default chat ID is only used when the project has
+        neither, so a project can be routed to forum topics alone.
+        """
+        project = self.get_project(project_path)
+        if project is None or not (project.telegram_chat_id or project.destinations):
+            chat_id = self.get_chat_id(project_path)
+            return [TelegramDestination(chat_id=chat_id)] if chat_id else []
+
+        destinations: List[TelegramDestination] = []
+        if project.telegram_chat_id:
+            destinations.append(TelegramDestination(chat_id=project.telegram_chat_id))
+        for destination in project.destinations:
+            if destination not in destinations:
+                destinations.append(destination)
+        return destinations
+
+    def add_destination(
+        self,
+        project_path: str,
+        chat_id: str,
+        message_thread_id: Optional[int] = None,
+    ) -> bool:
+        """Add a destination to a project. Returns False if project is unknown."""
+        project = self.get_project(project_path)
+        if project is None:
+            return False
+
+        destination = TelegramDestination(
+            chat_id=chat_id, message_thread_id=message_thread_id
+        )
+        if destination not in project.destinations:
+            project.destinations.append(destination)
+            self.save()
+        return True
+
+    def remove_destination(
+        self,
+        project_path: str,
+        chat_id: str,
+        message_thread_id: Optional[int] = None,
+    ) -> bool:
+        """Remove a destination from a project. Returns False if not found."""
+        project = self.get_project(project_path)
+        if project is None:
+            return False
+
+        destination = TelegramDestination(
+            chat_id=chat_id, message_thread_id=message_thread_id
+        )
+        if destination not in project.destinations:
+            return False
+        project.destinations.remove(destination)
+        self.save()
+        return True
+
 
 # Global projects manager instance
 projects_manager = ProjectsManager()
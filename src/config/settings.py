@@ -2,7 +2,7 @@
 # ABOUTME: Manages environment variables, project-specific configs, and feature flags.
 
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -22,6 +22,17 @@ class Settings(BaseSettings):
     api_host: str = Field(default="0.0.0.0", description="API server host")
     api_port: int = Field(default=9999, description="API server port")
     api_reload: bool = Field(default=False, description="Enable auto-reload in dev")
+    cors_allow_origins: List[str] = Field(
+        default=["*"], description="Origins allowed to call the API from a browser"
+    )
+
+    # Quota settings (per API key, or per client IP when no keys are configured)
+    quota_requests_per_minute: int = Field(
+        default=60, gt=0, description="Default sustained request quota per client"
+    )
+    quota_burst: int = Field(
+        default=20, ge=1, description="Default maximum burst size per client"
+    )
 
     # Telegram settings
     telegram_bot_token: str = Field(
@@ -47,11 +58,41 @@ class Settings(BaseSettings):
         default=300, description="Timeout in seconds to wait for Telegram response"
     )
 
+    approval_window_seconds: int = Field(
+        default=600, description="Duration of a timed auto-approval in seconds"
+    )
+    approval_session_ttl: int = Field(
+        default=86400, description="Max lifetime of a session auto-approval"
+    )
+
+    # Live event stream settings
+    stream_buffer_size: int = Field(
+        default=100, ge=1, description="Buffered events per stream subscriber"
+    )
+    stream_max_subscribers: int = Field(
+        default=50, description="Maximum concurrent stream subscribers"
+    )
+    stream_allow_anonymous: bool = Field(
+        default=False,
+        description="Allow the event stream without API keys (exposes hook content)",
+    )
+    stream_cors_allow_origins: List[str] = Field(
+        default_factory=list,
+        description="Browser origins allowed to read the event stream",
+    )
+    stream_keepalive_seconds: int = Field(
+        default=15, gt=0, description="Idle interval between stream keepalives"
+    )
+
     # Project settings
     projects_config_path: Path = Field(
         default=Path.home() / ".claude-telegram" / "projects.json",
         description="Path to projects configuration file",
     )
+    clients_config_path: Path = Field(
+        default=Path.home() / ".claude-telegram" / "clients.json",
+        description="Path to API clients configuration file",
+    )
 
     def get_api_url(self) -> str:
         """Get the full API URL."""
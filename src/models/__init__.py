@@ -2,6 +2,7 @@
 # ABOUTME: Centralizes Pydantic models for type safety across the application.
 
 from src.models.events import (
+    ApprovalScope,
     HookEvent,
     HookResponse,
     HookType,
@@ -10,6 +11,7 @@ from src.models.events import (
 )
 
 __all__ = [
+    "ApprovalScope",
     "HookEvent",
     "HookResponse",
     "HookType",
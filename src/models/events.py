@@ -27,6 +27,14 @@ class ResponseType(str, Enum):
     TIMEOUT = "timeout"
 
 
+class ApprovalScope(str, Enum):
+    """Scopes for remembering a "yes" answer to skip repeat prompts."""
+
+    TIMED = "timed"
+    SESSION = "session"
+    PROJECT = "project"
+
+
 class HookEvent(BaseModel):
     """Event sent from Claude hook to the API."""
 
@@ -50,7 +58,10 @@ class TelegramResponse(BaseModel):
 
     response_type: ResponseType = Field(description="Type of response")
     message: Optional[str] = Field(default=None, description="Custom message if any")
-    session_id: str = Field(description="Session ID to match request")
+    request_id: str = Field(description="Request ID of the answered prompt")
+    approval_scope: Optional[ApprovalScope] = Field(
+        default=None, description="Scope to auto-approve matching prompts for"
+    )
     timestamp: float = Field(description="Unix timestamp of response")
 
 
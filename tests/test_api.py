@@ -1,10 +1,36 @@
 # ABOUTME: Test suite for FastAPI endpoints.
 # ABOUTME: Tests health checks, hook event processing, and project management.
 
+import importlib
+import logging
+
 import pytest
 from fastapi.testclient import TestClient
 
 from src.api.app import app
+from src.api.approvals import ApprovalCache, fingerprint_event
+from src.api.broadcaster import EventBroadcaster
+from src.api.quotas import QuotaManager
+from src.config import ClientConfig, settings
+from src.config.projects import ProjectConfig
+from src.models import ApprovalScope, HookEvent, ResponseType, TelegramResponse
+
+# The module, not the FastAPI instance re-exported by src.api
+app_module = importlib.import_module("src.api.app")
+
+
+@pytest.fixture(autouse=True)
+def no_api_clients(monkeypatch):
+    """Ignore any real clients.json so tests run without API keys by default."""
+    monkeypatch.setattr(app_module.clients_manager, "clients", {})
+
+
+@pytest.fixture(autouse=True)
+def quota_manager(monkeypatch):
+    """Give each test fresh quotas."""
+    manager = QuotaManager()
+    monkeypatch.setattr(app_module, "quota_manager", manager)
+    return manager
 
 
 @pytest.fixture
@@ -40,3 +66,279 @@ def test_list_projects_empty(client):
     data = response.json()
     assert "projects" in data
     assert isinstance(data["projects"], list)
+
+
+@pytest.fixture
+def answer_scope():
+    """Approval scope of the stubbed "yes" answer (override with parametrize)."""
+    return ApprovalScope.PROJECT
+
+
+@pytest.fixture
+def sent_notifications(monkeypatch, answer_scope):
+    """Stub Telegram sends; interactive prompts are answered with a scoped yes."""
+    calls = []
+
+    async def send_notification(**kwargs):
+        calls.append(kwargs)
+        if not kwargs.get("requires_response"):
+            return None
+        return TelegramResponse(
+            response_type=ResponseType.YES,
+            request_id=kwargs["request_id"],
+            approval_scope=answer_scope,
+            timestamp=0.0,
+        )
+
+    monkeypatch.setattr(settings, "telegram_chat_id", "111")
+    monkeypatch.setattr(app_module.telegram_bot, "send_notification", send_notification)
+    monkeypatch.setattr(app_module, "approval_cache", ApprovalCache())
+    return calls
+
+
+def test_scoped_approval_answers_repeat_prompts(client, sent_notifications):
+    """Test a scoped yes auto-approves the next matching prompt server-side."""
+    event = {
+        "hook_type": "notification",
+        "project_path": "/tmp/approval-project",
+        "message": "Run the tests?",
+        "requires_response": True,
+    }
+
+    first = client.post("/hooks/event", json=event)
+    assert first.status_code == 200
+    assert first.json()["response_type"] == "yes"
+    assert sent_notifications[0]["requires_response"]
+    assert ApprovalScope.PROJECT in sent_notifications[0]["approval_scopes"]
+
+    second = client.post("/hooks/event", json=event)
+    assert second.status_code == 200
+    assert second.json()["response_type"] == "yes"
+    assert second.json()["message"] == "Auto-approved by policy"
+
+    # The repeat prompt is only logged silently, without waiting for an answer
+    assert len(sent_notifications) == 2
+    assert sent_notifications[1]["silent"]
+    assert not sent_notifications[1].get("requires_response")
+
+    # A different question still goes to Telegram
+    other = dict(event, message="Delete the database?")
+    client.post("/hooks/event", json=other)
+    assert sent_notifications[2]["requires_response"]
+
+
+@pytest.fixture
+def api_clients(monkeypatch, no_api_clients):
+    """Require API keys: "all-key" may use any project, "one-key" only /allowed."""
+    monkeypatch.setattr(
+        app_module.clients_manager,
+        "clients",
+        {
+            "all-key": ClientConfig(name="all"),
+            "one-key": ClientConfig(name="one", projects=["/allowed"], burst=1),
+        },
+    )
+
+
+def test_missing_or_invalid_api_key_rejected(client, api_clients):
+    """Test protected endpoints need a valid API key once clients exist."""
+    assert client.post("/hooks/event", json={}).status_code == 401
+    response = client.post(
+        "/projects/add",
+        params={"project_path": "/allowed", "name": "Allowed"},
+        headers={"X-API-Key": "wrong"},
+    )
+    assert response.status_code == 401
+    assert client.get("/projects").status_code == 401
+
+
+@pytest.mark.parametrize("answer_scope", [ApprovalScope.SESSION])
+def test_session_approval_answers_same_session(client, sent_notifications):
+    """Test a session-scoped yes only auto-approves prompts in that session."""
+    session_id = "claude-session-" + "x" * 60
+    event = {
+        "hook_type": "custom",
+        "project_path": "/tmp/session-project",
+        "message": "Run the tests?",
+        "requires_response": True,
+        "session_id": session_id,
+    }
+
+    assert client.post("/hooks/event", json=event).json()["response_type"] == "yes"
+    assert ApprovalScope.SESSION in sent_notifications[0]["approval_scopes"]
+    # Callbacks use a short per-prompt ID, not the (possibly long) session ID
+    assert len(sent_notifications[0]["request_id"]) == 32
+
+    second = client.post("/hooks/event", json=event)
+    assert second.json()["message"] == "Auto-approved by policy"
+    assert sent_notifications[1]["silent"]
+
+    other_session = dict(event, session_id="another-session")
+    client.post("/hooks/event", json=other_session)
+    assert sent_notifications[2]["requires_response"]
+
+    # Without a session ID the session button is not offered
+    no_session = dict(event, session_id=None, message="Deploy?")
+    client.post("/hooks/event", json=no_session)
+    assert ApprovalScope.SESSION not in sent_notifications[3]["approval_scopes"]
+
+
+def test_api_key_limited_to_projects(
+    client, api_clients, sent_notifications, quota_manager
+):
+    """Test clients cannot act on projects outside their allowed list."""
+    headers = {"X-API-Key": "all-key"}
+    event = {
+        "hook_type": "notification",
+        "project_path": "/other",
+        "message": "hello",
+    }
+    assert client.post("/hooks/event", json=event, headers=headers).status_code == 200
+
+    headers = {"X-API-Key": "one-key"}
+    response = client.post("/hooks/event", json=event, headers=headers)
+    assert response.status_code == 403
+
+    quota_manager.buckets.clear()
+    response = client.post("/projects//other/disable", headers=headers)
+    assert response.status_code == 403
+
+
+def test_over_quota_rejected_before_body_parsing(client, api_clients, quota_manager):
+    """Test over-quota requests get a cheap 429 without body validation."""
+    headers = {"X-API-Key": "one-key"}
+    assert client.post("/hooks/event", json={}, headers=headers).status_code == 422
+
+    response = client.post("/hooks/event", content=b"not json", headers=headers)
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    assert quota_manager.usage["one"] == {"accepted": 1, "rejected": 1}
+
+
+def test_anonymous_quota_per_client_ip(client, monkeypatch):
+    """Test quotas apply per client IP when no API keys are configured."""
+    monkeypatch.setattr(settings, "quota_burst", 1)
+    assert client.post("/hooks/event", json={}).status_code == 422
+    response = client.post("/hooks/event", json={})
+    assert response.status_code == 429
+    assert "Retry-After" in response.headers
+
+
+def test_event_stream_requires_api_keys(client):
+    """Test the event stream is refused when API keys are not configured."""
+    response = client.get("/events/stream", headers={"Origin": "http://evil.example"})
+    assert response.status_code == 403
+    assert "access-control-allow-origin" not in response.headers
+
+
+def test_event_stream_cors_not_wildcard(client):
+    """Test the event stream does not inherit the wildcard CORS origins."""
+    headers = {
+        "Origin": "http://evil.example",
+        "Access-Control-Request-Method": "GET",
+    }
+    response = client.options("/events/stream", headers=headers)
+    assert "access-control-allow-origin" not in response.headers
+
+    response = client.options("/projects/add", headers=headers)
+    assert response.headers["access-control-allow-origin"] == "http://evil.example"
+
+
+def test_access_log_redacts_api_key():
+    """Test API keys passed in the query string are not written to access logs."""
+    record = logging.LogRecord(
+        "uvicorn.access",
+        logging.INFO,
+        __file__,
+        0,
+        '%s - "%s %s HTTP/%s" %d',
+        ("1.2.3.4", "GET", "/events/stream?api_key=secret&hook_type=stop", "1.1", 200),
+        None,
+    )
+    assert app_module.RedactApiKeyFilter().filter(record)
+    assert "secret" not in record.getMessage()
+    assert "api_key=***&hook_type=stop" in record.getMessage()
+
+
+def test_disabled_project_events_not_streamed(client, sent_notifications, monkeypatch):
+    """Test only events accepted for delivery reach stream subscribers."""
+    broadcaster = EventBroadcaster()
+    subscriber = broadcaster.subscribe()
+    monkeypatch.setattr(app_module, "event_broadcaster", broadcaster)
+    event = {"hook_type": "stop", "project_path": "/streamed", "message": "done"}
+
+    monkeypatch.setattr(
+        app_module.projects_manager, "is_project_enabled", lambda path: False
+    )
+    assert client.post("/hooks/event", json=event).json()["response_type"] == "no"
+    assert subscriber.queue.empty()
+
+    monkeypatch.setattr(
+        app_module.projects_manager, "is_project_enabled", lambda path: True
+    )
+    client.post("/hooks/event", json=event)
+    types = [subscriber.queue.get_nowait()["type"] for _ in range(2)]
+    assert types == ["hook_event", "hook_response"]
+
+
+def test_auto_approval_without_destinations(client, sent_notifications, monkeypatch):
+    """Test approved prompts are answered even when no chat is configured."""
+    event = {
+        "hook_type": "custom",
+        "project_path": "/tmp/no-chat-project",
+        "message": "Run the tests?",
+        "requires_response": True,
+    }
+    app_module.approval_cache.record(
+        ApprovalScope.PROJECT,
+        event["project_path"],
+        None,
+        fingerprint_event(HookEvent(**event)),
+    )
+    monkeypatch.setattr(settings, "telegram_chat_id", None)
+
+    response = client.post("/hooks/event", json=event)
+    assert response.status_code == 200
+    assert response.json()["message"] == "Auto-approved by policy"
+    assert sent_notifications == []
+
+    other = dict(event, message="Delete the database?")
+    assert client.post("/hooks/event", json=other).status_code == 500
+
+
+def test_list_projects_scoped_to_client(client, api_clients, monkeypatch):
+    """Test API clients only see projects they are allowed to use."""
+    monkeypatch.setattr(
+        app_module.projects_manager,
+        "projects",
+        {
+            path: ProjectConfig(name=path, project_path=path)
+            for path in ("/allowed", "/other")
+        },
+    )
+    assert client.get("/projects").status_code == 401
+
+    def listed(api_key):
+        response = client.get("/projects", headers={"X-API-Key": api_key})
+        return [project["path"] for project in response.json()["projects"]]
+
+    assert listed("one-key") == ["/allowed"]
+    assert listed("all-key") == ["/allowed", "/other"]
+
+
+def test_clients_usage_only_shows_caller(client, quota_manager, api_clients):
+    """Test usage counters never expose other clients or caller IPs."""
+    quota_manager.acquire("anonymous:10.0.0.1", requests_per_minute=60, burst=5)
+    quota_manager.acquire("all", requests_per_minute=60, burst=5)
+
+    response = client.get("/clients/usage", headers={"X-API-Key": "one-key"})
+    assert list(response.json()["usage"]) == ["one"]
+
+
+def test_clients_usage_anonymous(client, quota_manager):
+    """Test callers without API keys only see their own IP's counters."""
+    quota_manager.acquire("anonymous:10.0.0.1", requests_per_minute=60, burst=5)
+
+    usage = client.get("/clients/usage").json()["usage"]
+    assert list(usage) == ["anonymous:testclient"]
+    assert usage["anonymous:testclient"]["accepted"] == 1
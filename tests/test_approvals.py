@@ -0,0 +1,78 @@
+# ABOUTME: Test suite for the scoped auto-approval policy cache.
+# ABOUTME: Tests fingerprinting, scope matching, and policy expiry.
+
+import pytest
+
+from src.api import approvals
+from src.api.approvals import ApprovalCache, fingerprint_event
+from src.models import ApprovalScope, HookEvent
+
+
+@pytest.fixture
+def cache():
+    """Create an empty approval cache."""
+    return ApprovalCache()
+
+
+def make_event(message: str) -> HookEvent:
+    """Create an interactive hook event with the given message."""
+    return HookEvent(
+        hook_type="notification",
+        project_path="/project",
+        message=message,
+        requires_response=True,
+    )
+
+
+def test_fingerprint_normalizes_whitespace_and_case():
+    """Test trivially different prompts share a fingerprint."""
+    assert fingerprint_event(make_event("Run  tests?")) == fingerprint_event(
+        make_event("run tests?\n")
+    )
+    assert fingerprint_event(make_event("Run tests?")) != fingerprint_event(
+        make_event("Delete files?")
+    )
+
+
+def test_project_scope_matches_any_session(cache):
+    """Test project approvals apply across sessions."""
+    cache.record(ApprovalScope.PROJECT, "/project", "s1", "fp")
+    assert cache.match("/project", "s2", "fp")
+    assert cache.match("/project", None, "fp")
+    assert not cache.match("/other", "s1", "fp")
+    assert not cache.match("/project", "s1", "other")
+
+
+def test_session_scope_is_limited_to_session(cache):
+    """Test session approvals only match the same session."""
+    cache.record(ApprovalScope.SESSION, "/project", "s1", "fp")
+    assert cache.match("/project", "s1", "fp")
+    assert not cache.match("/project", "s2", "fp")
+    assert not cache.match("/project", None, "fp")
+
+
+def test_session_scope_requires_session_id(cache):
+    """Test session approvals are ignored without a session ID."""
+    cache.record(ApprovalScope.SESSION, "/project", None, "fp")
+    assert cache.policies == {}
+
+
+def test_timed_scope_expires(cache, monkeypatch):
+    """Test timed approvals expire after the configured window."""
+    now = 1000.0
+    monkeypatch.setattr(approvals.time, "time", lambda: now)
+    cache.record(ApprovalScope.TIMED, "/project", "s1", "fp")
+    assert cache.match("/project", "s2", "fp")
+
+    now += approvals.settings.approval_window_seconds + 1
+    assert not cache.match("/project", "s2", "fp")
+    assert cache.policies == {}
+
+
+def test_clear_project(cache):
+    """Test clearing policies for one project keeps the others."""
+    cache.record(ApprovalScope.PROJECT, "/project", None, "fp")
+    cache.record(ApprovalScope.PROJECT, "/other", None, "fp")
+    cache.clear("/project")
+    assert not cache.match("/project", None, "fp")
+    assert cache.match("/other", None, "fp")
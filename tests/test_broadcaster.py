@@ -0,0 +1,145 @@
+# ABOUTME: Test suite for the live event stream broadcaster.
+# ABOUTME: Tests subscriber filters, drop-oldest buffering, and the SSE endpoint.
+
+import importlib
+import json
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from src.api.broadcaster import EventBroadcaster, format_sse
+from src.config import ClientConfig, settings
+from src.models import HookType
+
+# The module, not the FastAPI instance re-exported by src.api
+app_module = importlib.import_module("src.api.app")
+
+
+@pytest.fixture
+def broadcaster():
+    """Create a broadcaster with no subscribers."""
+    return EventBroadcaster()
+
+
+def drain(subscriber):
+    """Get all buffered messages from a subscriber."""
+    messages = []
+    while not subscriber.queue.empty():
+        messages.append(subscriber.queue.get_nowait())
+    return messages
+
+
+def test_publish_filters_by_project_and_hook_type(broadcaster):
+    """Test subscribers only receive messages matching their filters."""
+    everything = broadcaster.subscribe()
+    by_project = broadcaster.subscribe(project_paths={"/a"})
+    by_hook = broadcaster.subscribe(hook_types={"stop"})
+
+    broadcaster.publish("hook_event", "/a", "notification", {})
+    broadcaster.publish("hook_event", "/b", "stop", {})
+
+    assert [m["project_path"] for m in drain(everything)] == ["/a", "/b"]
+    assert [m["project_path"] for m in drain(by_project)] == ["/a"]
+    assert [m["project_path"] for m in drain(by_hook)] == ["/b"]
+
+
+def test_full_buffer_drops_oldest(broadcaster, monkeypatch):
+    """Test a slow subscriber loses the oldest messages, not the newest."""
+    monkeypatch.setattr(settings, "stream_buffer_size", 2)
+    subscriber = broadcaster.subscribe()
+
+    for index in range(5):
+        broadcaster.publish("hook_event", "/a", "stop", {"index": index})
+
+    assert [m["data"]["index"] for m in drain(subscriber)] == [3, 4]
+    assert subscriber.dropped == 3
+
+
+def test_subscriber_limit(broadcaster, monkeypatch):
+    """Test subscribing fails once the subscriber limit is reached."""
+    monkeypatch.setattr(settings, "stream_max_subscribers", 1)
+    subscriber = broadcaster.subscribe()
+    assert broadcaster.subscribe() is None
+
+    broadcaster.unsubscribe(subscriber)
+    assert broadcaster.subscribe() is not None
+
+
+def test_format_sse():
+    """Test Server-Sent Events framing."""
+    assert format_sse("dropped", {"count": 2}) == (
+        f"event: dropped\ndata: {json.dumps({'count': 2})}\n\n"
+    )
+    assert format_sse("hook_event", {}, 7).startswith("id: 7\nevent: hook_event\n")
+
+
+@pytest.fixture
+def stream(monkeypatch, broadcaster):
+    """Open /events/stream against a fresh broadcaster; returns an opener."""
+    monkeypatch.setattr(app_module, "event_broadcaster", broadcaster)
+    monkeypatch.setattr(settings, "stream_allow_anonymous", True)
+
+    async def open_stream(client=None, project_path=(), hook_type=()):
+        request = SimpleNamespace(state=SimpleNamespace(client=client))
+        response = await app_module.stream_events(
+            request, project_path=list(project_path), hook_type=list(hook_type)
+        )
+        return response.body_iterator
+
+    return open_stream
+
+
+@pytest.mark.asyncio
+async def test_stream_filters_events(stream, broadcaster):
+    """Test the stream only sends events matching its query filters."""
+    frames = await stream(project_path=["/a"], hook_type=[HookType.STOP])
+
+    broadcaster.publish("hook_event", "/a", "notification", {"n": 1})
+    broadcaster.publish("hook_event", "/b", "stop", {"n": 2})
+    broadcaster.publish("hook_event", "/a", "stop", {"n": 3})
+
+    frame = await anext(frames)
+    assert frame.startswith("id: 3\nevent: hook_event\n")
+    assert broadcaster.subscribers.pop().queue.empty()
+    await frames.aclose()
+
+
+@pytest.mark.asyncio
+async def test_stream_limited_to_client_projects(stream, broadcaster):
+    """Test API clients only see projects they are allowed to use."""
+    client = ClientConfig(name="one", projects=["/a", "/b"])
+
+    await stream(client=client, project_path=["/b", "/c"])
+    assert broadcaster.subscribers.pop().project_paths == {"/b"}
+
+    await stream(client=client)
+    assert broadcaster.subscribers.pop().project_paths == {"/a", "/b"}
+
+    with pytest.raises(HTTPException) as error:
+        await stream(client=client, project_path=["/c"])
+    assert error.value.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_stream_reports_dropped_events(stream, broadcaster, monkeypatch):
+    """Test a slow reader is told how many events it missed."""
+    monkeypatch.setattr(settings, "stream_buffer_size", 1)
+    frames = await stream()
+
+    broadcaster.publish("hook_event", "/a", "stop", {"n": 1})
+    broadcaster.publish("hook_event", "/a", "stop", {"n": 2})
+
+    assert await anext(frames) == format_sse("dropped", {"count": 1})
+    assert (await anext(frames)).startswith("id: 2\n")
+    await frames.aclose()
+    assert not broadcaster.subscribers
+
+
+@pytest.mark.asyncio
+async def test_stream_subscriber_limit(stream, monkeypatch):
+    """Test the stream returns 503 once the subscriber limit is reached."""
+    monkeypatch.setattr(settings, "stream_max_subscribers", 0)
+    with pytest.raises(HTTPException) as error:
+        await stream()
+    assert error.value.status_code == 503
@@ -0,0 +1,72 @@
+# ABOUTME: Test suite for project configuration management.
+# ABOUTME: Tests per-project Telegram destinations and their persistence.
+
+import pytest
+
+from src.config import ProjectsManager, TelegramDestination, settings
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Create a projects manager backed by a temporary config file."""
+    return ProjectsManager(config_path=tmp_path / "projects.json")
+
+
+def test_destinations_fall_back_to_default_chat(manager, monkeypatch):
+    """Test unknown projects are sent to the default chat ID."""
+    monkeypatch.setattr(settings, "telegram_chat_id", "111")
+    assert manager.get_destinations("/unknown") == [TelegramDestination(chat_id="111")]
+
+
+def test_destinations_replace_default_chat(manager, monkeypatch):
+    """Test a project with destinations is not also sent to the default chat."""
+    monkeypatch.setattr(settings, "telegram_chat_id", "111")
+    manager.add_project("/project", "Project")
+    assert manager.get_destinations("/project") == [TelegramDestination(chat_id="111")]
+
+    assert manager.add_destination("/project", "-100222", message_thread_id=7)
+    assert manager.get_destinations("/project") == [
+        TelegramDestination(chat_id="-100222", message_thread_id=7),
+    ]
+
+
+def test_project_chat_id_comes_first(manager, monkeypatch):
+    """Test the project's own chat ID is kept first and not duplicated."""
+    monkeypatch.setattr(settings, "telegram_chat_id", "111")
+    manager.add_project("/project", "Project")
+    manager.projects["/project"].telegram_chat_id = "333"
+
+    assert manager.add_destination("/project", "-100222", message_thread_id=7)
+    assert manager.add_destination("/project", "333")
+
+    assert manager.get_destinations("/project") == [
+        TelegramDestination(chat_id="333"),
+        TelegramDestination(chat_id="-100222", message_thread_id=7),
+    ]
+
+
+def test_destinations_persist(manager, tmp_path):
+    """Test destinations survive a reload from disk."""
+    manager.add_project("/project", "Project")
+    manager.add_destination("/project", "-100222", message_thread_id=7)
+
+    reloaded = ProjectsManager(config_path=tmp_path / "projects.json")
+    assert reloaded.get_project("/project").destinations == [
+        TelegramDestination(chat_id="-100222", message_thread_id=7)
+    ]
+
+
+def test_destination_unknown_project(manager):
+    """Test destinations cannot be added to or removed from unknown projects."""
+    assert not manager.add_destination("/unknown", "111")
+    assert not manager.remove_destination("/unknown", "111")
+
+
+def test_remove_destination(manager):
+    """Test removing a destination."""
+    manager.add_project("/project", "Project")
+    manager.add_destination("/project", "-100222", message_thread_id=7)
+
+    assert not manager.remove_destination("/project", "-100222")
+    assert manager.remove_destination("/project", "-100222", message_thread_id=7)
+    assert manager.get_project("/project").destinations == []
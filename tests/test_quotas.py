@@ -0,0 +1,94 @@
+# ABOUTME: Test suite for token-bucket quotas and API client configuration.
+# ABOUTME: Tests bucket refill, usage counters, and per-project client access.
+
+import json
+
+import pytest
+
+from src.api import quotas
+from src.api.quotas import QuotaManager, TokenBucket
+from src.config import ClientConfig, ClientsManager
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the monotonic clock with a controllable one."""
+    now = [1000.0]
+    monkeypatch.setattr(quotas.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_bucket_allows_burst_then_limits(clock):
+    """Test a bucket allows a burst and then reports the wait time."""
+    bucket = TokenBucket(rate=1.0, capacity=2)
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == pytest.approx(1.0)
+
+    clock[0] += 1.0
+    assert bucket.acquire() == 0.0
+
+
+def test_quota_manager_counts_usage(clock):
+    """Test accepted and rejected requests are counted per client."""
+    manager = QuotaManager()
+    assert manager.acquire("a", requests_per_minute=60, burst=1) == 0.0
+    assert manager.acquire("a", requests_per_minute=60, burst=1) > 0
+    assert manager.acquire("b", requests_per_minute=60, burst=1) == 0.0
+
+    assert manager.usage == {
+        "a": {"accepted": 1, "rejected": 1},
+        "b": {"accepted": 1, "rejected": 0},
+    }
+
+
+def test_quota_manager_prunes_idle_buckets(clock):
+    """Test only buckets of idle clients are pruned."""
+    manager = QuotaManager()
+    manager.acquire("idle", requests_per_minute=60, burst=1)
+    clock[0] += 10
+    manager.acquire("busy", requests_per_minute=60, burst=1)
+
+    manager.prune()
+    assert list(manager.buckets) == ["busy"]
+
+
+def test_clients_manager(tmp_path):
+    """Test loading clients and checking project access."""
+    config_path = tmp_path / "clients.json"
+    manager = ClientsManager(config_path=config_path)
+    assert not manager.is_auth_enabled()
+
+    config_path.write_text(
+        json.dumps({"secret": {"name": "ci", "projects": ["/project"]}})
+    )
+    manager.load()
+    assert manager.is_auth_enabled()
+    assert manager.get_client("wrong") is None
+
+    client = manager.get_client("secret")
+    assert client.allows_project("/project")
+    assert not client.allows_project("/other")
+    assert ClientConfig(name="all").allows_project("/other")
+
+
+def test_prune_bounds_buckets_and_usage(clock, monkeypatch):
+    """Test pruning evicts least recently used buckets and their usage."""
+    monkeypatch.setattr(quotas, "MAX_BUCKETS", 2)
+    manager = QuotaManager()
+    for client in ("a", "b", "c"):
+        manager.acquire(client, requests_per_minute=60, burst=5)
+        clock[0] += 0.1
+
+    assert list(manager.buckets) == ["b", "c"]
+    assert list(manager.usage) == ["b", "c"]
+
+
+def test_clients_manager_rejects_duplicate_names(tmp_path):
+    """Test two API keys cannot share a client name (and thus a quota)."""
+    config_path = tmp_path / "clients.json"
+    config_path.write_text(
+        json.dumps({"key1": {"name": "team"}, "key2": {"name": "team", "burst": 2}})
+    )
+    with pytest.raises(ValueError, match="team"):
+        ClientsManager(config_path=config_path)
@@ -0,0 +1,192 @@
+# ABOUTME: Test suite for the Telegram bot fan-out and response handling.
+# ABOUTME: Uses a fake Telegram bot to test concurrent sends and message updates.
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.bot.telegram_bot import TelegramBot
+from src.config import TelegramDestination, settings
+from src.models import ApprovalScope, ResponseType
+
+
+class FakeBot:
+    """Records sends and edits; chats listed in `failing` raise on send."""
+
+    def __init__(self, failing=(), blocked=()):
+        self.failing = set(failing)
+        self.blocked = set(blocked)
+        self.release = asyncio.Event()
+        self.sent = []
+        self.edits = []
+
+    async def send_message(self, chat_id, **kwargs):
+        if chat_id in self.failing:
+            raise RuntimeError(f"chat {chat_id} unavailable")
+        if chat_id in self.blocked:
+            await self.release.wait()
+        self.sent.append((chat_id, kwargs))
+        return SimpleNamespace(message_id=len(self.sent))
+
+    async def edit_message_text(self, text, chat_id, message_id):
+        self.edits.append((chat_id, text))
+
+
+class FakeQuery:
+    """Minimal stand-in for a Telegram callback query."""
+
+    def __init__(self, data):
+        self.data = data
+        self.edited = None
+
+    async def answer(self):
+        pass
+
+    async def edit_message_text(self, text):
+        self.edited = text
+
+
+def make_bot(fake_bot):
+    """Create a TelegramBot wired to a fake Telegram bot."""
+    bot = TelegramBot()
+    bot.app = SimpleNamespace(bot=fake_bot)
+    return bot
+
+
+async def click(bot, data):
+    """Simulate a button click and return the query."""
+    query = FakeQuery(data)
+    await bot._handle_button_response(SimpleNamespace(callback_query=query), None)
+    return query
+
+
+@pytest.mark.asyncio
+async def test_fan_out_isolates_failing_destination():
+    """Test a failing destination does not stop delivery to the others."""
+    fake = FakeBot(failing={"bad"})
+    bot = make_bot(fake)
+
+    await bot.send_notification(
+        destinations=[
+            TelegramDestination(chat_id="a"),
+            TelegramDestination(chat_id="bad"),
+            TelegramDestination(chat_id="b", message_thread_id=7),
+        ],
+        message="hello",
+    )
+
+    assert [chat_id for chat_id, _ in fake.sent] == ["a", "b"]
+    assert fake.sent[1][1]["message_thread_id"] == 7
+
+
+@pytest.mark.asyncio
+async def test_fan_out_raises_when_every_destination_fails():
+    """Test an error is raised and state cleaned up if nothing was delivered."""
+    bot = make_bot(FakeBot(failing={"bad"}))
+
+    with pytest.raises(RuntimeError):
+        await bot.send_notification(
+            destinations=[TelegramDestination(chat_id="bad")],
+            message="hello",
+            request_id="s1",
+            requires_response=True,
+        )
+    assert bot.pending_responses == {}
+    assert bot.sent_messages == {}
+
+
+@pytest.mark.asyncio
+async def test_first_answer_mid_send_updates_every_copy():
+    """Test a click arriving before all sends finish resolves and updates all."""
+    fake = FakeBot(failing={"bad"}, blocked={"slow"})
+    bot = make_bot(fake)
+
+    task = asyncio.create_task(
+        bot.send_notification(
+            destinations=[
+                TelegramDestination(chat_id="fast"),
+                TelegramDestination(chat_id="bad"),
+                TelegramDestination(chat_id="slow"),
+            ],
+            message="Continue?",
+            request_id="s1",
+            requires_response=True,
+            approval_scopes=[ApprovalScope.SESSION],
+        )
+    )
+    while not fake.sent:
+        await asyncio.sleep(0)
+
+    await click(bot, "s1:yes:session")
+    assert fake.edits == [("fast", "✅ Response received: yes (for this session)")]
+
+    fake.release.set()
+    response = await task
+
+    assert response.response_type == ResponseType.YES
+    assert response.approval_scope == ApprovalScope.SESSION
+    assert ("slow", "✅ Response received: yes (for this session)") in fake.edits
+    assert bot.pending_responses == {}
+    assert bot.sent_messages == {}
+
+
+@pytest.mark.asyncio
+async def test_later_answers_are_ignored():
+    """Test only the first answer from any destination is used."""
+    fake = FakeBot()
+    bot = make_bot(fake)
+
+    task = asyncio.create_task(
+        bot.send_notification(
+            destinations=[
+                TelegramDestination(chat_id="a"),
+                TelegramDestination(chat_id="b"),
+            ],
+            message="Continue?",
+            request_id="s1",
+            requires_response=True,
+        )
+    )
+    while len(fake.sent) < 2:
+        await asyncio.sleep(0)
+
+    await click(bot, "s1:no")
+    late = await click(bot, "s1:yes")
+
+    assert (await task).response_type == ResponseType.NO
+    assert late.edited == "ℹ️ This prompt was already answered"
+
+
+@pytest.mark.asyncio
+async def test_invalid_approval_scope_is_ignored():
+    """Test callback data with an unknown scope does not resolve the prompt."""
+    bot = make_bot(FakeBot())
+    bot.pending_responses["s1"] = asyncio.get_running_loop().create_future()
+
+    await click(bot, "s1:yes:forever")
+    assert not bot.pending_responses["s1"].done()
+
+
+@pytest.mark.asyncio
+async def test_timeout_updates_every_copy(monkeypatch):
+    """Test timed-out prompts have their buttons replaced on every copy."""
+    monkeypatch.setattr(settings, "response_timeout", 0)
+    fake = FakeBot()
+    bot = make_bot(fake)
+
+    response = await bot.send_notification(
+        destinations=[
+            TelegramDestination(chat_id="a"),
+            TelegramDestination(chat_id="b"),
+        ],
+        message="Continue?",
+        request_id="s1",
+        requires_response=True,
+    )
+
+    assert response.response_type == ResponseType.TIMEOUT
+    assert sorted(fake.edits) == [
+        ("a", "⏱️ Response timed out"),
+        ("b", "⏱️ Response timed out"),
+    ]